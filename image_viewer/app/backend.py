@@ -71,7 +71,9 @@ class EngineImageProvider(QQuickImageProvider):
         if pix and not pix.isNull():
             return pix
 
-        # Handle percent-encoded paths.
+        # Handle percent-encoded paths; ids without '%' have nothing to decode.
+        if "%" not in path:
+            return QPixmap()
         with _suppress_expected(TypeError, ValueError, OSError):
             path_dec = QUrl.fromPercentEncoding(path.encode("utf-8"))
             pix = self._engine.get_cached_pixmap(path_dec)
@@ -98,6 +100,16 @@ class ThumbImageProvider(QQuickImageProvider):
         self._cache_misses = 0
         self._cache_evictions = 0
         self._requests = 0
+        # Shared 1x1 transparent placeholder for misses; QPixmap is implicitly
+        # shared, so handing out the same instance avoids an alloc+fill per miss.
+        self._placeholder: QPixmap | None = None
+
+    def _placeholder_pixmap(self) -> QPixmap:
+        if self._placeholder is None:
+            pix = QPixmap(1, 1)
+            pix.fill(Qt.GlobalColor.transparent)
+            self._placeholder = pix
+        return self._placeholder
 
     def _log_cache_stats(self) -> None:
         total = self._cache_hits + self._cache_misses
@@ -168,15 +180,11 @@ class ThumbImageProvider(QQuickImageProvider):
                 data = self._thumb_bytes_by_key.get(str(key_dec))
 
         if not data:
-            pix = QPixmap(1, 1)
-            pix.fill(Qt.GlobalColor.transparent)
-            return pix
+            return self._placeholder_pixmap()
 
         pix = QPixmap()
         if not pix.loadFromData(data):
-            placeholder = QPixmap(1, 1)
-            placeholder.fill(Qt.GlobalColor.transparent)
-            return placeholder
+            return self._placeholder_pixmap()
 
         self._cache_put(cache_id, pix)
 
@@ -1095,8 +1103,12 @@ class BackendFacade(QObject):
         if self._pending_select_path:
             target = abs_path_str(str(self._pending_select_path))
             self._pending_select_path = None
-            if target in norm:
-                self._set_current_index(norm.index(target))
+            try:
+                idx = norm.index(target)
+            except ValueError:
+                pass
+            else:
+                self._set_current_index(idx)
                 return
 
         if norm and self._explorer._get_current_index() < 0:
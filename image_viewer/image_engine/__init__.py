@@ -15,9 +15,24 @@ Usage:
     engine.request_decode(path)
 """
 
-try:
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
     from .engine import ImageEngine
-except Exception:  # pragma: no cover - allow importing submodules without PySide6 in tests
-    ImageEngine = None
 
 __all__ = ["ImageEngine"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve ImageEngine lazily so Qt-free submodules (db, decoder, meta_utils)
+    # can be imported without paying for PySide6/engine start-up.
+    if name == "ImageEngine":
+        try:
+            from .engine import ImageEngine  # noqa: PLC0415
+        except Exception:  # pragma: no cover - allow importing submodules without PySide6 in tests
+            ImageEngine = None
+        globals()["ImageEngine"] = ImageEngine
+        return ImageEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import queue
+import random
 import sqlite3
 import threading
 import time
@@ -18,6 +20,28 @@ from ..metrics import metrics
 
 _logger = get_logger("db_operator")
 
+# Retry backoff for transient OperationalError ("database is locked").
+_RETRY_BASE_DELAY_S = 0.001
+_RETRY_MAX_DELAY_S = 0.1
+
+# Per-connection cache tuning. Thumbnail rows are small BLOBs read in large
+# batches, so a bigger page cache and memory-mapped reads avoid most read()
+# syscalls.
+_CACHE_SIZE_KIB = 64 * 1024
+_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+# sqlite3's per-connection prepared-statement LRU (default 128). The chunked
+# IN (?, ...) lookups produce one distinct statement per chunk length.
+_CACHED_STATEMENTS = 256
+
+# A worker closes its connection after this long without tasks. The DB lives in
+# the user's photo folder, and SQLite only removes the -wal/-shm side files when
+# the last connection closes, so idle operators must not keep them around.
+_IDLE_CLOSE_S = 2.0
+
+# Reader threads per operator. Under WAL, readers on their own connections run
+# concurrently with the single writer instead of queueing behind it.
+_DEFAULT_READER_COUNT = min(4, os.cpu_count() or 1)
+
 
 @dataclass
 class _DbTask:
@@ -26,14 +50,22 @@ class _DbTask:
     kwargs: dict
     future: Future
     retries: int = 3
+    # Write tasks run inside `BEGIN IMMEDIATE` so lock contention surfaces up
+    # front instead of on a mid-transaction read->write lock upgrade.
+    write: bool = True
 
 
 class DbOperator:
     """Serialized DB operation queue / worker.
 
-    This class owns a single sqlite3 connection and a worker thread that
-    executes queued tasks against that connection. It applies basic PRAGMAs
-    (WAL, busy_timeout) and retries transient `sqlite3.OperationalError`.
+    Writes are executed in order by a single writer thread on its own sqlite3
+    connection. Reads go to a small pool of reader threads, each with its own
+    connection, so under WAL they proceed while a write is in flight
+    (`reader_count=0` serializes reads on the writer as well). Every
+    connection is opened lazily by its thread, reused across a burst of
+    tasks and closed once the thread has been idle for `_IDLE_CLOSE_S` or
+    exits, so the folder's -wal/-shm files do not outlive the activity. It applies basic PRAGMAs (WAL,
+    busy_timeout) and retries transient `sqlite3.OperationalError`.
 
     Instances are tracked in a weak set so tests can ensure all operators are
     shut down cleanly before interpreter exit, preventing native crashes.
@@ -42,26 +74,34 @@ class DbOperator:
     # Weakly-track live instances for test-time cleanup
     _LIVE: weakref.WeakSet[DbOperator] = weakref.WeakSet()
 
-    def __init__(self, db_path: Path | str, busy_timeout_ms: int = 5000):
+    def __init__(self, db_path: Path | str, busy_timeout_ms: int = 5000, reader_count: int = _DEFAULT_READER_COUNT):
         # Register instance before starting the worker thread so registrant
         # sees a valid object even if a thread starts immediately.
         DbOperator._LIVE.add(self)
         self._db_path = Path(db_path)
         # Use Any to allow sentinel objects in the queue for shutdown wake-up
         self._queue: queue.Queue[Any] = queue.Queue()
-        # Non-daemon thread so we can reliably join on shutdown and avoid
-        # interpreter-exit races where C extensions are unloaded while the
+        self._read_queue: queue.Queue[Any] = queue.Queue()
+        # Non-daemon threads so we can reliably join on shutdown and avoid
+        # interpreter-exit races where C extensions are unloaded while a
         # thread is still running.
-        self._thread = threading.Thread(target=self._worker, daemon=False, name="DbOperatorWorker")
+        self._thread = threading.Thread(target=self._worker, args=(self._queue,), daemon=False, name="DbOperatorWorker")
+        self._reader_threads = [
+            threading.Thread(target=self._worker, args=(self._read_queue,), daemon=False, name=f"DbOperatorReader-{i}")
+            for i in range(max(0, int(reader_count)))
+        ]
         self._stop_event = threading.Event()
         self._busy_timeout_ms = int(busy_timeout_ms)
         # Sentinel object used to wake the queue when shutting down
         self._sentinel = object()
+        # Retry jitter source; only drawn from by the operator's own threads.
+        self._rng = random.Random()
         self._thread.start()
+        for t in self._reader_threads:
+            t.start()
 
     def _open_conn(self) -> sqlite3.Connection:
-        # Create a fresh connection per task to avoid long locks/held file handles.
-        conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False, cached_statements=_CACHED_STATEMENTS)
         try:
             conn.execute("PRAGMA journal_mode=WAL")
         except Exception:
@@ -70,6 +110,19 @@ class DbOperator:
             conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
         except Exception:
             _logger.debug("PRAGMA busy_timeout failed", exc_info=True)
+        # WAL stays consistent with synchronous=NORMAL (only the last commits can
+        # be lost on power failure), and avoids an fsync per thumbnail write.
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+        except Exception:
+            _logger.debug("PRAGMA synchronous/temp_store failed", exc_info=True)
+        try:
+            # Negative cache_size is in KiB rather than pages.
+            conn.execute(f"PRAGMA cache_size = -{_CACHE_SIZE_KIB}")
+            conn.execute(f"PRAGMA mmap_size = {_MMAP_SIZE_BYTES}")
+        except Exception:
+            _logger.debug("PRAGMA cache_size/mmap_size failed", exc_info=True)
         return conn
 
     def schedule_write(self, fn: Callable[[sqlite3.Connection, Any], Any], *args, retries: int = 3, **kwargs) -> Future:
@@ -79,85 +132,84 @@ class DbOperator:
         metrics.inc("db_operator.write_queued")
         return fut
 
-    def schedule_write_batch(
-        self, funcs: list[tuple[Callable[[sqlite3.Connection, Any], Any], tuple, dict]], retries: int = 3
-    ) -> Future:
-        """Schedule a batch of write functions to be executed inside a single transaction.
-
-        funcs: list of tuples (fn, args, kwargs)
-        """
-        fut: Future = Future()
-
-        def _batch(conn: sqlite3.Connection, *_args, **_kwargs) -> None:
-            for fn, args, kwargs in funcs:
-                fn(conn, *args, **kwargs)
-
-        task = _DbTask(fn=_batch, args=(), kwargs={}, future=fut, retries=retries)
-        self._queue.put(task)
-        return fut
-
     def schedule_read(self, fn: Callable[[sqlite3.Connection, Any], Any], *args, **kwargs) -> Future:
-        # For now serialize reads as well to keep a single-threaded connection model.
         fut: Future = Future()
-        task = _DbTask(fn=fn, args=args, kwargs=kwargs, future=fut, retries=1)
-        self._queue.put(task)
+        task = _DbTask(fn=fn, args=args, kwargs=kwargs, future=fut, retries=1, write=False)
+        (self._read_queue if self._reader_threads else self._queue).put(task)
         metrics.inc("db_operator.read_queued")
         return fut
 
-    def _worker(self) -> None:  # noqa: PLR0912, PLR0915
-        """Worker loop that executes DB tasks.
+    def _worker(self, tasks: queue.Queue[Any]) -> None:  # noqa: PLR0912, PLR0915
+        """Worker loop that executes DB tasks from `tasks`.
 
         The loop is robust to exceptions and recognizes a sentinel object which
-        causes an orderly shutdown even when blocked on queue.get()."""
+        causes an orderly shutdown even when blocked on queue.get().
+
+        Each worker reuses one connection across a burst of tasks: re-opening
+        per task repeats the file open, PRAGMA setup and schema parse and drops
+        the page cache. Once idle it closes the connection again so no file
+        handles or WAL side files are held while nothing uses the DB."""
+        conn: sqlite3.Connection | None = None
+        last_task = time.monotonic()
         while True:
             try:
                 try:
-                    item = self._queue.get(timeout=0.1)
+                    item = tasks.get(timeout=0.1)
                 except queue.Empty:
                     if self._stop_event.is_set():
                         break
+                    if conn is not None and time.monotonic() - last_task >= _IDLE_CLOSE_S:
+                        self._close_worker_conn(conn, tasks)
+                        conn = None
                     continue
 
                 # Recognize sentinel to allow immediate wake-up during shutdown
                 if item is self._sentinel:
                     _logger.debug("DbOperator worker received sentinel; exiting")
-                    self._queue.task_done()
+                    tasks.task_done()
                     break
 
                 task: _DbTask = item
 
                 attempt = 0
                 while True:
-                    conn = None
                     try:
                         with metrics.timed("db_operator.task_duration"):
-                            conn = self._open_conn()
+                            if conn is None:
+                                conn = self._open_conn()
+                            if task.write:
+                                conn.execute("BEGIN IMMEDIATE")
                             res = task.fn(conn, *task.args, **task.kwargs)
-                        # commit after each write attempt to keep DB durable.
-                        with contextlib.suppress(Exception):
+                            # Commit after each task to keep the DB durable. A failed
+                            # commit is handled like a failed task (rollback + retry or
+                            # exception) so no transaction is left open on the shared
+                            # connection and the future never reports a lost write.
                             conn.commit()
                         task.future.set_result(res)
                         break
                     except sqlite3.OperationalError as exc:
                         attempt += 1
                         metrics.inc("db_operator.write_retries")
+                        if conn is not None:
+                            with contextlib.suppress(Exception):
+                                conn.rollback()
                         if attempt > (task.retries or 0):
                             task.future.set_exception(exc)
                             break
-                        backoff = 0.05 * attempt
-                        time.sleep(backoff)
+                        time.sleep(self._retry_delay(attempt))
                         continue
                     except Exception as exc:
                         _logger.exception("DbOperator task raised exception: %s", exc)
+                        # Don't let a half-applied task leak into the next one.
+                        if conn is not None:
+                            with contextlib.suppress(Exception):
+                                conn.rollback()
                         try:
                             task.future.set_exception(exc)
                         except Exception:
                             _logger.debug("Failed to set exception on future", exc_info=True)
                         break
-                    finally:
-                        if conn:
-                            with contextlib.suppress(Exception):
-                                conn.close()
+                last_task = time.monotonic()
             except Exception:
                 # Log any unexpected errors and continue; avoid letting the
                 # thread die silently due to an unhandled exception.
@@ -165,23 +217,50 @@ class DbOperator:
             finally:
                 # Ensure queue.task_done is called if a task was processed
                 with contextlib.suppress(Exception):
-                    self._queue.task_done()
+                    tasks.task_done()
+        if conn is not None:
+            self._close_worker_conn(conn, tasks)
+
+    def _close_worker_conn(self, conn: sqlite3.Connection, tasks: queue.Queue[Any]) -> None:
+        if tasks is self._queue:
+            self._finalize_writer_conn(conn)
+        with contextlib.suppress(Exception):
+            conn.close()
+
+    @staticmethod
+    def _finalize_writer_conn(conn: sqlite3.Connection) -> None:
+        # Refresh planner stats for the next open (bounded by analysis_limit so
+        # closing a large DB stays cheap) and fold the WAL back into the main
+        # file without waiting on readers.
+        try:
+            conn.execute("PRAGMA analysis_limit = 400")
+            conn.execute("PRAGMA optimize")
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        except Exception:
+            _logger.debug("PRAGMA optimize/wal_checkpoint on close failed", exc_info=True)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter: U(0, min(cap, base * 2**attempt)) seconds."""
+        return self._rng.uniform(0.0, min(_RETRY_MAX_DELAY_S, _RETRY_BASE_DELAY_S * (2**attempt)))
 
     def shutdown(self, wait: bool = True) -> None:
-        """Signal the worker to stop and optionally wait for it to finish."""
+        """Signal the workers to stop and optionally wait for them to finish."""
         self._stop_event.set()
-        # Put sentinel in queue to wake the worker if it's blocked on get().
+        # Put one sentinel per thread to wake any worker blocked on get().
         try:
             self._queue.put(self._sentinel)
+            for _ in self._reader_threads:
+                self._read_queue.put(self._sentinel)
         except Exception:
             _logger.debug("failed to enqueue sentinel", exc_info=True)
         if wait:
-            try:
-                self._thread.join(timeout=10)
-                if self._thread.is_alive():
-                    _logger.warning("DbOperator worker did not stop within timeout")
-            except Exception:
-                _logger.exception("Exception while joining DbOperator worker")
+            for t in (self._thread, *self._reader_threads):
+                try:
+                    t.join(timeout=10)
+                    if t.is_alive():
+                        _logger.warning("DbOperator worker %s did not stop within timeout", t.name)
+                except Exception:
+                    _logger.exception("Exception while joining DbOperator worker")
         # Remove from live set
         with contextlib.suppress(Exception):
             DbOperator._LIVE.discard(self)
@@ -199,4 +278,4 @@ class DbOperator:
             cls._LIVE.clear()
 
     def is_alive(self) -> bool:
-        return self._thread.is_alive()
+        return self._thread.is_alive() or any(t.is_alive() for t in self._reader_threads)
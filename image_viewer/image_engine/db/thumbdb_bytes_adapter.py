@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import platform
 from collections.abc import Iterable
 from pathlib import Path
@@ -64,6 +65,61 @@ _THUMB_SELECT_COLS: Final[tuple[str, ...]] = (
 
 _THUMB_SELECT_SQL: Final[str] = ", ".join(_THUMB_SELECT_COLS)
 
+# Full DDL for the current schema, rendered once at import time. Statements are
+# executed one by one (not via executescript(), which COMMITs first) so a schema
+# rebuild stays inside the operator's write transaction.
+_THUMB_SCHEMA_STATEMENTS: Final[tuple[str, ...]] = (
+    f"CREATE TABLE IF NOT EXISTS {THUMB_TABLE} (\n"
+    + ",\n".join(f"{name} {decl}" for name, decl in _THUMB_COL_DEFS)
+    + "\n)",
+    f"CREATE INDEX IF NOT EXISTS idx_mtime ON {THUMB_TABLE}({COL_MTIME})",
+    f"CREATE INDEX IF NOT EXISTS idx_created_at ON {THUMB_TABLE}({COL_CREATED_AT})",
+    f"PRAGMA user_version = {THUMB_DB_SCHEMA_VERSION}",
+)
+
+_UPSERT_SQL: Final[str] = f"""
+INSERT INTO {THUMB_TABLE} (
+    {COL_PATH}, {COL_MTIME}, {COL_SIZE}, {COL_WIDTH}, {COL_HEIGHT},
+    {COL_THUMB_WIDTH}, {COL_THUMB_HEIGHT}, {COL_THUMBNAIL}, {COL_CREATED_AT}
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT({COL_PATH}) DO UPDATE SET
+    {COL_MTIME} = excluded.{COL_MTIME},
+    {COL_SIZE} = excluded.{COL_SIZE},
+    {COL_WIDTH} = excluded.{COL_WIDTH},
+    {COL_HEIGHT} = excluded.{COL_HEIGHT},
+    {COL_THUMB_WIDTH} = excluded.{COL_THUMB_WIDTH},
+    {COL_THUMB_HEIGHT} = excluded.{COL_THUMB_HEIGHT},
+    {COL_THUMBNAIL} = excluded.{COL_THUMBNAIL},
+    {COL_CREATED_AT} = excluded.{COL_CREATED_AT}
+"""
+
+
+# Above this many keys, `get_rows_for_paths` stages the keys in a TEMP table
+# instead of binding them into one giant IN (...) list (which must be re-parsed
+# for every distinct length and can hit SQLITE_MAX_VARIABLE_NUMBER).
+_IN_LIST_MAX_PATHS: Final[int] = 500
+_QUERY_PATHS_TABLE: Final[str] = "_thumb_query_paths"
+_QUERY_PATHS_DDL: Final[str] = f"CREATE TEMP TABLE IF NOT EXISTS {_QUERY_PATHS_TABLE} ({COL_PATH} TEXT PRIMARY KEY)"
+_QUERY_PATHS_INSERT_SQL: Final[str] = f"INSERT OR IGNORE INTO temp.{_QUERY_PATHS_TABLE} ({COL_PATH}) VALUES (?)"
+_QUERY_PATHS_CLEAR_SQL: Final[str] = f"DELETE FROM temp.{_QUERY_PATHS_TABLE}"
+
+
+def _rows_for_paths_sql(count: int) -> str:
+    """SELECT used by `get_rows_for_paths` for `count` bound path keys.
+
+    Small sets bind the keys inline; larger sets read them from the TEMP table
+    filled just before the query.
+    """
+    if count > _IN_LIST_MAX_PATHS:
+        return (
+            f"SELECT {_THUMB_SELECT_SQL} FROM {THUMB_TABLE} "
+            f"WHERE {COL_PATH} IN (SELECT {COL_PATH} FROM temp.{_QUERY_PATHS_TABLE})"
+        )
+    placeholders = ",".join("?" * count)
+    return f"SELECT {_THUMB_SELECT_SQL} FROM {THUMB_TABLE} WHERE {COL_PATH} IN ({placeholders})"
+
+
 RowType = tuple[
     str,
     bytes | None,
@@ -78,6 +134,25 @@ RowType = tuple[
 
 _logger = get_logger("thumbnail_db")
 
+_FILE_ATTRIBUTE_HIDDEN: Final[int] = 0x02
+
+
+@functools.cache
+def _set_file_attributes_w():
+    """kernel32.SetFileAttributesW bound once with explicit argtypes/restype.
+
+    Uses a private WinDLL handle so setting the prototype doesn't affect other
+    users of `ctypes.windll.kernel32`. Returns None off Windows or without ctypes.
+    """
+    if platform.system() != "Windows" or ctypes is None:
+        return None
+    from ctypes import wintypes  # noqa: PLC0415 - Windows-only
+
+    fn = ctypes.WinDLL("kernel32").SetFileAttributesW
+    fn.argtypes = (wintypes.LPCWSTR, wintypes.DWORD)
+    fn.restype = wintypes.BOOL
+    return fn
+
 
 def _set_hidden_attribute_immediate(path: Path) -> None:
     """Attempt to set hidden attribute on `path` immediately (no sleeps).
@@ -86,20 +161,19 @@ def _set_hidden_attribute_immediate(path: Path) -> None:
     file is being created/opened.
     """
 
-    if platform.system() != "Windows":
-        return
-    if ctypes is None:
+    set_attrs = _set_file_attributes_w()
+    if set_attrs is None:
         return
 
     try:
         path_str = abs_path_str(path)
-        res = ctypes.windll.kernel32.SetFileAttributesW(path_str, 0x02)
+        res = set_attrs(path_str, _FILE_ATTRIBUTE_HIDDEN)
         if res == 0:
             # Try long-path prefix fallback
             prefixed = path_str
             if not path_str.startswith("\\\\?\\"):
                 prefixed = "\\\\?\\" + path_str
-            res = ctypes.windll.kernel32.SetFileAttributesW(prefixed, 0x02)
+            res = set_attrs(prefixed, _FILE_ATTRIBUTE_HIDDEN)
         if res == 0:
             _logger.debug("SetFileAttributesW failed (immediate) for %s", path)
         else:
@@ -134,13 +208,14 @@ def _set_hidden_attribute_on_path(path: Path) -> None:
             _logger.debug("_set_hidden_attribute_on_path: file does not exist: %s", db_path)
             return
 
-        if ctypes is None:
+        set_attrs = _set_file_attributes_w()
+        if set_attrs is None:
             _logger.debug("_set_hidden_attribute_on_path: ctypes missing, skipping")
             return
 
         path_str = str(db_path)
         _logger.debug("_set_hidden_attribute_on_path: calling SetFileAttributesW for %s", path_str)
-        result = ctypes.windll.kernel32.SetFileAttributesW(path_str, 0x02)
+        result = set_attrs(path_str, _FILE_ATTRIBUTE_HIDDEN)
         if result == 0:
             prefixed = path_str
             if not path_str.startswith("\\\\?\\"):
@@ -149,7 +224,7 @@ def _set_hidden_attribute_on_path(path: Path) -> None:
                 "_set_hidden_attribute_on_path: initial call failed, trying long-path prefix: %s",
                 prefixed,
             )
-            result = ctypes.windll.kernel32.SetFileAttributesW(prefixed, 0x02)
+            result = set_attrs(prefixed, _FILE_ATTRIBUTE_HIDDEN)
 
         if result == 0:
             _logger.debug("SetFileAttributesW failed for %s", db_path)
@@ -241,11 +316,8 @@ class ThumbDBBytesAdapter:
                     conn.execute("DROP INDEX IF EXISTS idx_mtime")
                     conn.execute("DROP INDEX IF EXISTS idx_created_at")
 
-                cols_sql = ",\n".join(f"{name} {decl}" for name, decl in _THUMB_COL_DEFS)
-                conn.execute(f"CREATE TABLE IF NOT EXISTS {THUMB_TABLE} (\n{cols_sql}\n)")
-                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_mtime ON {THUMB_TABLE}({COL_MTIME})")
-                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_created_at ON {THUMB_TABLE}({COL_CREATED_AT})")
-                conn.execute(f"PRAGMA user_version = {THUMB_DB_SCHEMA_VERSION}")
+                for stmt in _THUMB_SCHEMA_STATEMENTS:
+                    conn.execute(stmt)
 
                 _set_hidden_attribute_immediate(self._db_path)
 
@@ -286,6 +358,16 @@ class ThumbDBBytesAdapter:
 
         return self._operator.schedule_read(_do).result()
 
+    def probe_exists(self, path: str) -> bool:
+        """Whether `path` has a row, without reading its thumbnail BLOB."""
+        key = db_key(path)
+
+        def _do(conn, *_args, **_kwargs):
+            row = conn.execute(f"SELECT 1 FROM {THUMB_TABLE} WHERE {COL_PATH} = ? LIMIT 1", (key,)).fetchone()
+            return row is not None
+
+        return self._operator.schedule_read(_do).result()
+
     def get_rows_for_paths(self, paths: Iterable[str]) -> list[RowType]:
         query_paths = [db_key(p) for p in paths]
         if not query_paths:
@@ -295,11 +377,16 @@ class ThumbDBBytesAdapter:
         query_paths = list(dict.fromkeys(query_paths))
 
         def _do(conn, qpaths):
-            placeholders = ",".join(["?" for _ in qpaths])
-            rows = conn.execute(
-                f"SELECT {_THUMB_SELECT_SQL} FROM {THUMB_TABLE} WHERE {COL_PATH} IN ({placeholders})",
-                list(qpaths),
-            ).fetchall()
+            if len(qpaths) > _IN_LIST_MAX_PATHS:
+                conn.execute(_QUERY_PATHS_DDL)
+                conn.execute(_QUERY_PATHS_CLEAR_SQL)
+                conn.executemany(_QUERY_PATHS_INSERT_SQL, ((p,) for p in qpaths))
+                try:
+                    rows = conn.execute(_rows_for_paths_sql(len(qpaths))).fetchall()
+                finally:
+                    conn.execute(_QUERY_PATHS_CLEAR_SQL)
+            else:
+                rows = conn.execute(_rows_for_paths_sql(len(qpaths)), qpaths).fetchall()
             out: list[RowType] = []
             for r in rows:
                 out.append(
@@ -319,91 +406,49 @@ class ThumbDBBytesAdapter:
 
         return self._operator.schedule_read(_do, query_paths).result()
 
-    def upsert_meta(self, path: str, mtime: int, size: int, meta: dict | None = None) -> None:
-        key = db_key(path)
+    def probe_many(self, paths: Iterable[str]) -> dict[str, RowType]:
+        """Batch form of `probe`: one query for all `paths`, keyed by `db_key`.
+
+        Paths without a row are absent from the result.
+        """
+        return {row[0]: row for row in self.get_rows_for_paths(paths)}
+
+    @staticmethod
+    def _meta_params(path: str, mtime: int, size: int, meta: dict | None) -> tuple:
+        """Build the bound parameters for one upsert row (column order of _UPSERT_SQL)."""
         tw = 0 if meta is None or meta.get("thumb_width") is None else int(meta.get("thumb_width"))
         th = 0 if meta is None or meta.get("thumb_height") is None else int(meta.get("thumb_height"))
         created_at = 0.0 if meta is None or meta.get("created_at") is None else float(meta.get("created_at"))
+        return (
+            db_key(path),
+            int(mtime),
+            int(size),
+            None if meta is None else meta.get("width"),
+            None if meta is None else meta.get("height"),
+            int(tw),
+            int(th),
+            None if meta is None else meta.get("thumbnail"),
+            float(created_at),
+        )
+
+    def upsert_meta(self, path: str, mtime: int, size: int, meta: dict | None = None) -> None:
+        params = self._meta_params(path, mtime, size, meta)
 
         def _do(conn, *_args, **_kwargs):
-            conn.execute(
-                f"""
-                INSERT INTO {THUMB_TABLE} (
-                    {COL_PATH}, {COL_MTIME}, {COL_SIZE}, {COL_WIDTH}, {COL_HEIGHT},
-                    {COL_THUMB_WIDTH}, {COL_THUMB_HEIGHT}, {COL_THUMBNAIL}, {COL_CREATED_AT}
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT({COL_PATH}) DO UPDATE SET
-                    {COL_MTIME} = excluded.{COL_MTIME},
-                    {COL_SIZE} = excluded.{COL_SIZE},
-                    {COL_WIDTH} = excluded.{COL_WIDTH},
-                    {COL_HEIGHT} = excluded.{COL_HEIGHT},
-                    {COL_THUMB_WIDTH} = excluded.{COL_THUMB_WIDTH},
-                    {COL_THUMB_HEIGHT} = excluded.{COL_THUMB_HEIGHT},
-                    {COL_THUMBNAIL} = excluded.{COL_THUMBNAIL},
-                    {COL_CREATED_AT} = excluded.{COL_CREATED_AT}
-                """,
-                (
-                    key,
-                    int(mtime),
-                    int(size),
-                    None if meta is None else meta.get("width"),
-                    None if meta is None else meta.get("height"),
-                    int(tw),
-                    int(th),
-                    None if meta is None else meta.get("thumbnail"),
-                    float(created_at),
-                ),
-            )
+            conn.execute(_UPSERT_SQL, params)
 
         self._operator.schedule_write(_do).result()
 
     def upsert_meta_many(self, rows: list[tuple[str, int, int, dict | None]]) -> None:
-        funcs: list[tuple] = []
-
-        def _make_fn(path: str, mtime: int, size: int, meta: dict | None):
-            key = db_key(path)
-            tw = 0 if meta is None or meta.get("thumb_width") is None else int(meta.get("thumb_width"))
-            th = 0 if meta is None or meta.get("thumb_height") is None else int(meta.get("thumb_height"))
-            created_at = 0.0 if meta is None or meta.get("created_at") is None else float(meta.get("created_at"))
-
-            def _fn(conn):
-                conn.execute(
-                    f"""
-                    INSERT INTO {THUMB_TABLE} (
-                        {COL_PATH}, {COL_MTIME}, {COL_SIZE}, {COL_WIDTH}, {COL_HEIGHT},
-                        {COL_THUMB_WIDTH}, {COL_THUMB_HEIGHT}, {COL_THUMBNAIL}, {COL_CREATED_AT}
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT({COL_PATH}) DO UPDATE SET
-                        {COL_MTIME} = excluded.{COL_MTIME},
-                        {COL_SIZE} = excluded.{COL_SIZE},
-                        {COL_WIDTH} = excluded.{COL_WIDTH},
-                        {COL_HEIGHT} = excluded.{COL_HEIGHT},
-                        {COL_THUMB_WIDTH} = excluded.{COL_THUMB_WIDTH},
-                        {COL_THUMB_HEIGHT} = excluded.{COL_THUMB_HEIGHT},
-                        {COL_THUMBNAIL} = excluded.{COL_THUMBNAIL},
-                        {COL_CREATED_AT} = excluded.{COL_CREATED_AT}
-                    """,
-                    (
-                        key,
-                        int(mtime),
-                        int(size),
-                        None if meta is None else meta.get("width"),
-                        None if meta is None else meta.get("height"),
-                        int(tw),
-                        int(th),
-                        None if meta is None else meta.get("thumbnail"),
-                        float(created_at),
-                    ),
-                )
-
-            return _fn
+        """Upsert many rows in one transaction with a single prepared statement."""
+        params = [self._meta_params(p, m, s, meta) for p, m, s, meta in rows]
+        if not params:
+            return
 
-        for p, m, s, meta in rows:
-            funcs.append((_make_fn(p, m, s, meta), (), {}))
+        def _do(conn, *_args, **_kwargs):
+            conn.executemany(_UPSERT_SQL, params)
 
-        self._operator.schedule_write_batch(funcs).result()
+        self._operator.schedule_write(_do).result()
 
     def delete(self, path: str) -> None:
         key = db_key(path)
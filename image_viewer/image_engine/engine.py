@@ -26,6 +26,14 @@ if TYPE_CHECKING:
 
 _logger = get_logger("engine")
 
+# Full-resolution pixmaps vary from a few hundred KB to hundreds of MB, so the
+# LRU is bounded by decoded bytes as well as by entry count.
+_PIXMAP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _pixmap_nbytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
 
 class ImageEngine(QObject):
     """Image processing engine - single entry point for all data/processing.
@@ -82,9 +90,14 @@ class ImageEngine(QObject):
         self._core.error.connect(self._on_core_error)
         self._core_thread.start()
 
-        # Pixmap cache (LRU)
+        # Pixmap cache (LRU), bounded by entry count and total decoded bytes
         self._pixmap_cache: OrderedDict[str, QPixmap] = OrderedDict()
         self._cache_size = 20
+        self._cache_max_bytes = _PIXMAP_CACHE_MAX_BYTES
+        self._cache_bytes = 0
+        # Last path passed to request_decode (the image on screen). Prefetches
+        # can push the cache over its byte budget; this entry is never evicted.
+        self._pinned_path: str | None = None
 
         # Decoding strategy - create shared instances to avoid duplicate init/logging
         self._full_strategy: DecodingStrategy = FullStrategy()
@@ -146,6 +159,7 @@ class ImageEngine(QObject):
 
         # Clear caches
         self.clear_cache()
+        self._pinned_path = None
         self._loader.clear_pending()
         self._meta_cache.clear()
         # Clear file list cache immediately; the directory worker will repopulate.
@@ -246,11 +260,12 @@ class ImageEngine(QObject):
             target_size: Optional (width, height) for resized decode
             priority: If True, process this request first (reserved for future use)
         """
+        self._pinned_path = path
         # Check cache first
         if path in self._pixmap_cache:
             # Move to end (LRU)
-            pix = self._pixmap_cache.pop(path)
-            self._pixmap_cache[path] = pix
+            self._pixmap_cache.move_to_end(path)
+            pix = self._pixmap_cache[path]
             _logger.debug("request_decode: cache hit for %s", path)
             self.image_ready.emit(path, pix, None)
             return
@@ -312,6 +327,7 @@ class ImageEngine(QObject):
     def clear_cache(self) -> None:
         """Clear the pixmap cache."""
         self._pixmap_cache.clear()
+        self._cache_bytes = 0
         _logger.debug("pixmap cache cleared")
 
     def remove_from_cache(self, path: str) -> bool:
@@ -323,8 +339,10 @@ class ImageEngine(QObject):
         Returns:
             True if path was in cache and removed
         """
-        removed = self._pixmap_cache.pop(path, None) is not None
+        pix = self._pixmap_cache.pop(path, None)
+        removed = pix is not None
         if removed:
+            self._cache_bytes -= _pixmap_nbytes(pix)
             _logger.debug("removed from cache: %s", path)
         return removed
 
@@ -417,17 +435,32 @@ class ImageEngine(QObject):
         """Get the fast decoding strategy instance."""
         return self._fast_strategy
 
-    def set_cache_size(self, size: int) -> None:
+    def set_cache_size(self, size: int, max_bytes: int | None = None) -> None:
         """Set pixmap cache size.
 
         Args:
             size: Maximum number of cached pixmaps
+            max_bytes: Optional cap on total decoded pixmap bytes
         """
         self._cache_size = max(1, size)
-        # Trim cache if needed
-        while len(self._pixmap_cache) > self._cache_size:
-            self._pixmap_cache.popitem(last=False)
-        _logger.debug("cache size set to: %d", self._cache_size)
+        if max_bytes is not None:
+            self._cache_max_bytes = max(0, int(max_bytes))
+        self._trim_cache()
+        _logger.debug("cache size set to: %d (max_bytes=%d)", self._cache_size, self._cache_max_bytes)
+
+    def _trim_cache(self) -> None:
+        # Evict least-recently-used entries, but never the pinned (displayed)
+        # image, and always keep one entry so an image larger than the byte
+        # budget can still be displayed.
+        cache = self._pixmap_cache
+        while len(cache) > 1 and (len(cache) > self._cache_size or self._cache_bytes > self._cache_max_bytes):
+            victim = next(iter(cache))
+            if victim == self._pinned_path:
+                # Treat the displayed image as most recently used and evict the next-oldest.
+                cache.move_to_end(victim)
+                victim = next(iter(cache))
+            pix = cache.pop(victim)
+            self._cache_bytes -= _pixmap_nbytes(pix)
 
     def set_thumbnail_size(self, width: int, height: int) -> None:
         """Set default thumbnail size.
@@ -450,7 +483,7 @@ class ImageEngine(QObject):
 
         _logger.debug("ImageEngine shutting down")
         self._loader.shutdown()
-        self._pixmap_cache.clear()
+        self.clear_cache()
         # Stop convert worker thread
         try:
             if hasattr(self, "_convert_thread") and self._convert_thread.isRunning():
@@ -509,18 +542,20 @@ class ImageEngine(QObject):
                 return
 
             # Cache the pixmap (LRU)
-            if path in self._pixmap_cache:
-                self._pixmap_cache.pop(path)
+            old = self._pixmap_cache.pop(path, None)
+            if old is not None:
+                self._cache_bytes -= _pixmap_nbytes(old)
             self._pixmap_cache[path] = pixmap
-            if len(self._pixmap_cache) > self._cache_size:
-                self._pixmap_cache.popitem(last=False)
+            self._cache_bytes += _pixmap_nbytes(pixmap)
+            self._trim_cache()
 
             _logger.debug(
-                "image converted: %s (%dx%d) cache_size=%d",
+                "image converted: %s (%dx%d) cache_size=%d cache_bytes=%d",
                 path,
                 pixmap.width(),
                 pixmap.height(),
                 len(self._pixmap_cache),
+                self._cache_bytes,
             )
             self.image_ready.emit(path, pixmap, None)
 
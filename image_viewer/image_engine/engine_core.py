@@ -36,7 +36,7 @@ from image_viewer.infra.logger import get_logger
 from image_viewer.infra.path_utils import abs_dir, abs_dir_str, db_key
 
 from .db.thumbdb_bytes_adapter import ThumbDBBytesAdapter
-from .decoder import encode_image_to_png, get_image_dimensions
+from .decoder import THUMB_PNG_COMPRESSION, encode_image_to_png, get_image_dimensions
 from .fs_db_worker import FSDBLoadWorker
 from .loader import Loader
 
@@ -55,6 +55,11 @@ _IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp", ".tif", ".tiff"
 _THUMB_DB_BASENAME = "swiftview_thumbs.db"
 _RGB_DIMS = 3
 _RGB_CHANNELS = 3
+# Generated thumbnails are written to the DB in batches: one transaction per
+# flush instead of one per thumbnail. Flush when this many rows are pending,
+# or after the debounce interval, whichever comes first.
+_UPSERT_BATCH_MAX = 64
+_UPSERT_FLUSH_MS = 150
 
 
 @dataclass(frozen=True)
@@ -112,6 +117,10 @@ class EngineCore(QObject):
         self._missing_thumb_seen: set[str] = set()
         self._missing_thumb_timer: QTimer | None = None
 
+        # Generated thumbnails waiting to be written to `_db` in one transaction.
+        self._pending_upserts: list[tuple[str, int, int, dict | None]] = []
+        self._upsert_flush_timer: QTimer | None = None
+
         # Watcher suppression + change detection.
         # QFileSystemWatcher will fire when we update the thumbnail DB in the folder.
         # Keep a short suppression window for self-induced writes, and only refresh
@@ -140,6 +149,11 @@ class EngineCore(QObject):
         self._missing_thumb_timer.setInterval(0)
         self._missing_thumb_timer.timeout.connect(self._pump_missing_thumb_queue)
 
+        self._upsert_flush_timer = QTimer(self)
+        self._upsert_flush_timer.setSingleShot(True)
+        self._upsert_flush_timer.setInterval(_UPSERT_FLUSH_MS)
+        self._upsert_flush_timer.timeout.connect(self._flush_pending_upserts)
+
         # Thumbnails are encoded directly to PNG bytes by the loader to avoid
         # materializing intermediate numpy arrays and extra copies.
         self._thumb_loader = Loader(encode_image_to_png)
@@ -157,6 +171,10 @@ class EngineCore(QObject):
             if self._missing_thumb_timer is not None:
                 self._missing_thumb_timer.stop()
 
+        with contextlib.suppress(Exception):
+            if self._upsert_flush_timer is not None:
+                self._upsert_flush_timer.stop()
+
         with contextlib.suppress(Exception):
             if self._watcher is not None:
                 # Remove all watched paths
@@ -172,6 +190,7 @@ class EngineCore(QObject):
             with contextlib.suppress(Exception):
                 self._thumb_loader.shutdown()
         if self._db is not None:
+            self._flush_pending_upserts()
             with contextlib.suppress(Exception):
                 self._db.close()
         self._thumb_pending.clear()
@@ -401,6 +420,9 @@ class EngineCore(QObject):
         if self._thumb_loader is None:
             _logger.debug("request_thumbnail: thumb_loader is None")
             return
+        if not path.lower().endswith(_IMAGE_EXTS):
+            _logger.debug("request_thumbnail: %s is not an image; skipping", path)
+            return
 
         key = db_key(path)
         if key in self._thumb_pending:
@@ -435,6 +457,8 @@ class EngineCore(QObject):
         db_path = Path(folder_abs) / "SwiftView_thumbs.db"
         # Replace DB when folder changes.
         if self._db is not None and self._db.db_path != db_path:
+            # Pending rows belong to the old folder's DB.
+            self._flush_pending_upserts()
             with contextlib.suppress(Exception):
                 self._db.close()
             self._db = None
@@ -451,6 +475,8 @@ class EngineCore(QObject):
         self._stop_db_loader()
         if self._db is None:
             return
+        # Let the preload see thumbnails generated since the last flush.
+        self._flush_pending_upserts()
 
         # If the DB exists but contains no thumbnails yet, the preload worker will
         # report everything as missing. For small folders we can just generate all
@@ -472,7 +498,7 @@ class EngineCore(QObject):
             folder_path=folder_abs,
             db_path=str(Path(folder_abs) / "SwiftView_thumbs.db"),
             db_operator=self._db.operator,
-            use_operator_for_reads=True,
+            db_adapter=self._db,
             thumb_width=self._thumb_size[0],
             thumb_height=self._thumb_size[1],
             generation=generation,
@@ -617,7 +643,7 @@ class EngineCore(QObject):
                 self._missing_thumb_timer.start()
 
     # ---- thumbnail generation --------------------------------------
-    def _on_thumb_decoded(self, path: str, image_data, error) -> None:
+    def _on_thumb_decoded(self, path: str, image_data, error) -> None:  # noqa: PLR0912
         # Runs in the thread that owns this EngineCore (queued).
         try:
             key = db_key(path)
@@ -635,6 +661,10 @@ class EngineCore(QObject):
             png_bytes: bytes | None = None
             if isinstance(image_data, (bytes, bytearray, memoryview)):
                 png_bytes = bytes(image_data)
+                if not png_bytes:
+                    # Nothing to store or show; don't stat/probe the file or queue a DB row.
+                    self.error.emit("thumb_encode", f"empty png for {path}")
+                    return
             else:
                 # If we receive a numpy array, attempt to encode it — but this is
                 # considered a secondary path and will produce an error if encoding
@@ -677,14 +707,12 @@ class EngineCore(QObject):
 
             # Store via bytes adapter (no Qt GUI types).
             if self._db is not None:
-                # DB updates will change the directory and can trigger watcher events.
-                self._suppress_watch_until = max(self._suppress_watch_until, time.monotonic() + 0.75)
-                _logger.debug("_on_thumb_decoded: storing thumbnail for %s", path)
-                self._db.upsert_meta(
+                _logger.debug("_on_thumb_decoded: queuing thumbnail store for %s", path)
+                self._queue_upsert(
                     path,
                     mtime_ms,
                     size,
-                    meta={
+                    {
                         "width": ow,
                         "height": oh,
                         "thumb_width": tw,
@@ -718,6 +746,29 @@ class EngineCore(QObject):
             with contextlib.suppress(Exception):
                 self._thumb_pending.discard(db_key(path))
 
+    def _queue_upsert(self, path: str, mtime_ms: int, size: int, meta: dict) -> None:
+        self._pending_upserts.append((path, mtime_ms, size, meta))
+        timer = self._upsert_flush_timer
+        if timer is None or len(self._pending_upserts) >= _UPSERT_BATCH_MAX:
+            self._flush_pending_upserts()
+        elif not timer.isActive():
+            timer.start()
+
+    @Slot()
+    def _flush_pending_upserts(self) -> None:
+        if self._upsert_flush_timer is not None:
+            self._upsert_flush_timer.stop()
+        rows, self._pending_upserts = self._pending_upserts, []
+        if not rows or self._db is None:
+            return
+        # DB updates will change the directory and can trigger watcher events.
+        self._suppress_watch_until = max(self._suppress_watch_until, time.monotonic() + 0.75)
+        try:
+            self._db.upsert_meta_many(rows)
+            _logger.debug("_flush_pending_upserts: stored %d thumbnails", len(rows))
+        except Exception as exc:
+            self.error.emit("thumb_store", str(exc))
+
     @staticmethod
     def _qimage_to_png_bytes(qimg: QImage) -> bytes:
         try:
@@ -775,7 +826,7 @@ class EngineCore(QObject):
         with contextlib.suppress(Exception):
             img = img.copy(interpretation="srgb")
 
-        out = img.write_to_buffer(".png")
+        out = img.write_to_buffer(".png", compression=THUMB_PNG_COMPRESSION)
         # Normalize to bytes in case pyvips returns a memoryview-like object
         if isinstance(out, bytes):
             return out
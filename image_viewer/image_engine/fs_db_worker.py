@@ -39,6 +39,7 @@ class FSDBLoadWorker(QObject):
         folder_path: str = "",
         db_path: str = "",
         db_operator: DbOperator | None = None,
+        db_adapter: ThumbDBBytesAdapter | None = None,
         **kwargs,
     ) -> None:
         parent = kwargs.get("parent")
@@ -52,6 +53,8 @@ class FSDBLoadWorker(QObject):
         self._chunk_size = int(kwargs.get("chunk_size", 800))
         self._stopped = False
         self._db_operator = db_operator
+        # An already-open adapter (e.g. EngineCore's) skips the per-run schema check.
+        self._db_adapter = db_adapter
 
     def configure(self, **kwargs) -> None:
         """구성 옵션 설정(예: chunk_size, whitelist 등)."""
@@ -65,6 +68,8 @@ class FSDBLoadWorker(QObject):
         구현은 DB 조회, 파일 검증, chunk emit 과 missing emit 을 담당합니다.
         예외는 `error` 시그널로 보고되어야 하며, 항상 `finished`를 emit 해야 합니다.
         """
+        db: ThumbDBBytesAdapter | None = None
+        db_owned = False
         try:
             # Use a stable, single convention for emitted/query paths.
             # We treat `db_key()` as the canonical storage/key format
@@ -84,7 +89,10 @@ class FSDBLoadWorker(QObject):
                 self.finished.emit(self._generation)
                 return
 
-            db = ThumbDBBytesAdapter(self._db_path, operator=self._db_operator)
+            db = self._db_adapter
+            if db is None:
+                db = ThumbDBBytesAdapter(self._db_path, operator=self._db_operator)
+                db_owned = True
             # Collect path stats
             paths_with_stats: list[tuple[str, int, int]] = []
             for p in folder.iterdir():
@@ -116,7 +124,7 @@ class FSDBLoadWorker(QObject):
             # Progress/metrics
             total = len(paths_with_stats)
             processed = 0
-            start_ts = time.time()
+            start_ns = time.perf_counter_ns()
             _logger.debug("FSDBLoadWorker run: total files=%d chunk_size=%d", total, self._chunk_size)
             # emit initial progress
             with suppress(Exception):
@@ -219,7 +227,7 @@ class FSDBLoadWorker(QObject):
                     if self._stopped:
                         break
                     self.missing_paths.emit(missing[i : i + step])
-            elapsed = time.time() - start_ts
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             _logger.debug("FSDBLoadWorker finished: processed=%d total=%d elapsed=%.3fs", processed, total, elapsed)
             with suppress(Exception):
                 self.progress.emit(total, total)
@@ -234,6 +242,12 @@ class FSDBLoadWorker(QObject):
                 }
             )
             self.finished.emit(self._generation)
+        finally:
+            # Release an operator the adapter created for this run; shared
+            # operators/adapters stay open for their owner.
+            if db_owned and db is not None:
+                with suppress(Exception):
+                    db.close()
 
     def stop(self) -> None:
         """중단 요청: run 루프는 주기적으로 `_stopped`를 확인해야 함."""
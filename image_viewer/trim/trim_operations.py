@@ -17,7 +17,7 @@ from PySide6.QtWidgets import QApplication, QMessageBox
 
 from image_viewer.image_engine.decoder import decode_image, get_image_dimensions
 from image_viewer.infra.logger import get_logger
-from image_viewer.trim.trim import apply_trim_to_file, detect_trim_box_stats, make_trim_preview
+from image_viewer.trim.trim import apply_trim_to_file, detect_trim_box_stats
 from image_viewer.trim.ui_trim import TrimBatchWorker, TrimPreviewDialog, TrimReportDialog
 
 _logger = get_logger("trim_operations")
@@ -94,23 +94,25 @@ class TrimPreloader(QThread):
         if crop:
             _, original_array, _err = decode_image(path)
             if original_array is not None:
-                original_pixmap = self._array_to_pixmap(original_array)
-                if original_pixmap is not None:
-                    preview_array = make_trim_preview(path, crop)
-                    if preview_array is not None:
+                h, w, _ = original_array.shape
+                left, top, trim_w, trim_h = crop
+                # Skip if no actual trimming
+                if not (trim_w == w and trim_h == h):
+                    original_pixmap = self._array_to_pixmap(original_array)
+                    if original_pixmap is not None:
+                        # Crop the preview from the pixels already decoded above instead
+                        # of decoding the file a second time; copy() keeps it contiguous
+                        # for QImage.
+                        preview_array = original_array[top : top + trim_h, left : left + trim_w].copy()
                         trimmed_pixmap = self._array_to_pixmap(preview_array)
                         if trimmed_pixmap is not None:
-                            # Skip if no actual trimming
-                            h, w, _ = original_array.shape
-                            trim_h, trim_w, _ = preview_array.shape
-                            if not (trim_w == w and trim_h == h):
-                                candidate = TrimCandidate(
-                                    path=path,
-                                    crop=crop,
-                                    original_pixmap=original_pixmap,
-                                    trimmed_pixmap=trimmed_pixmap,
-                                    original_array=original_array,
-                                )
+                            candidate = TrimCandidate(
+                                path=path,
+                                crop=crop,
+                                original_pixmap=original_pixmap,
+                                trimmed_pixmap=trimmed_pixmap,
+                                original_array=original_array,
+                            )
 
         return candidate
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import contextlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot
@@ -30,6 +32,8 @@ from image_viewer.ui.styles import apply_theme
 
 _logger = get_logger("ui_trim")
 
+_TRIM_BATCH_MAX_WORKERS = max(1, os.cpu_count() or 1)
+
 
 class TrimBatchWorker(QObject):
     progress = Signal(str, int, int, str)  # path, index (1-based), total, error
@@ -47,44 +51,50 @@ class TrimBatchWorker(QObject):
     def run(self) -> None:
         try:
             total = len(self.paths)
-            for idx, p in enumerate(self.paths, start=1):
-                err = None
-                try:
-                    result = detect_trim_box_stats(p, profile=self.profile)
-                    if result:
-                        _left, _top, width, height = result
-                        # Emit info for UI: target resolution
-                        with contextlib.suppress(Exception):
-                            self.trim_info.emit(p, width, height)
-                        # Skip saving if crop equals original image dimensions
-                        orig_w, orig_h = get_image_dimensions(p)
-                        if orig_w is None:
-                            orig_w = 0
-                        if orig_h is None:
-                            orig_h = 0
-                        # Register row for report
-                        self.report_rows.append((p, orig_w, orig_h, width, height))
-                        if orig_w is not None and orig_h is not None and width == orig_w and height == orig_h:
-                            _logger.debug("ui_trim: skipping %s (crop equals original size)", p)
-                        else:
-                            apply_trim_to_file(p, result, overwrite=False)  # Save as copy
-                    else:
-                        # No crop detected - inform UI
+            # Detection, the dimension probe and the crop/write are all native
+            # libvips work that releases the GIL, so files are processed in
+            # parallel; results are consumed in input order so the signals and
+            # report rows keep the same order as a sequential run.
+            with ThreadPoolExecutor(max_workers=_TRIM_BATCH_MAX_WORKERS) as pool:
+                futures = [pool.submit(self._trim_one, p) for p in self.paths]
+                for idx, (p, future) in enumerate(zip(self.paths, futures, strict=True), start=1):
+                    err = None
+                    try:
+                        row, err = future.result()
+                        # Emit info for UI: target resolution (0,0 means no trim detected)
                         with contextlib.suppress(Exception):
-                            self.trim_info.emit(p, 0, 0)
-                        # Ensure original dims are in report rows (no trim)
-                        orig_w, orig_h = get_image_dimensions(p)
-                        if orig_w is None:
-                            orig_w = 0
-                        if orig_h is None:
-                            orig_h = 0
-                        self.report_rows.append((p, orig_w, orig_h, 0, 0))
-                except Exception as ex:  # keep worker resilient
-                    err = str(ex)
-                self.progress.emit(p, idx, total, err)
+                            self.trim_info.emit(p, row[3], row[4])
+                        self.report_rows.append(row)
+                    except Exception as ex:  # keep worker resilient
+                        err = str(ex)
+                    self.progress.emit(p, idx, total, err)
         finally:
             self.finished.emit()
 
+    def _trim_one(self, path: str) -> tuple[tuple[str, int, int, int, int], str | None]:
+        """Detect and save the trim for one file; runs on a pool thread.
+
+        Returns the report row and the error from saving the copy, if any.
+        Detection errors propagate so the file gets no report row.
+        """
+        result = detect_trim_box_stats(path, profile=self.profile)
+        orig_w, orig_h = get_image_dimensions(path)
+        orig_w = orig_w or 0
+        orig_h = orig_h or 0
+        if not result:
+            return (path, orig_w, orig_h, 0, 0), None
+        _left, _top, width, height = result
+        row = (path, orig_w, orig_h, width, height)
+        # Skip saving if crop equals original image dimensions
+        if width == orig_w and height == orig_h:
+            _logger.debug("ui_trim: skipping %s (crop equals original size)", path)
+            return row, None
+        try:
+            apply_trim_to_file(path, result, overwrite=False)  # Save as copy
+        except Exception as ex:
+            return row, str(ex)
+        return row, None
+
 
 # No use but for later.
 class TrimProgressDialog(QDialog):
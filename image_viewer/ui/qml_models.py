@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -13,7 +14,12 @@ _MB = 1000**2
 _GB = 1000**3
 
 
-@dataclass
+def _thumb_url(thumb_gen: int, key: str) -> str:
+    # Include thumb_gen to force QML Image to refresh when bytes arrive.
+    return f"image://thumb/{thumb_gen}/{key}"
+
+
+@dataclass(slots=True)
 class QmlImageEntry:
     path: str
     name: str
@@ -25,6 +31,8 @@ class QmlImageEntry:
     width: int | None = None
     height: int | None = None
     thumb_gen: int = 0
+    # Cached `image://thumb/<gen>/<key>`; rebuilt only when thumb_gen changes.
+    thumb_url: str = ""
 
 
 class QmlImageGridModel(QAbstractListModel):
@@ -70,8 +78,7 @@ class QmlImageGridModel(QAbstractListModel):
             int(self.Roles.ResolutionText): lambda e: (f"{e.width}x{e.height}" if (e.width and e.height) else ""),
             int(self.Roles.Key): lambda e: e.key,
             int(self.Roles.ThumbGen): lambda e: int(e.thumb_gen),
-            # Include thumb_gen to force QML Image to refresh when bytes arrive.
-            int(self.Roles.ThumbUrl): lambda e: f"image://thumb/{e.thumb_gen}/{e.key}",
+            int(self.Roles.ThumbUrl): lambda e: e.thumb_url,
         }
 
     # ---- Qt model basics -----------------------------------------
@@ -112,8 +119,12 @@ class QmlImageGridModel(QAbstractListModel):
         return getter(entry)
 
     # ---- mutations (engine feeds) --------------------------------
-    def set_entries(self, entries: list[dict]) -> None:
-        """Replace model contents from EngineCore folder snapshot."""
+    def set_entries(self, entries: Iterable[dict]) -> None:
+        """Replace model contents from EngineCore folder snapshot.
+
+        `entries` may be any iterable (e.g. a generator filtering a larger
+        snapshot); it is consumed once and only image rows are kept.
+        """
         self.beginResetModel()
         try:
             self._entries = []
@@ -143,6 +154,7 @@ class QmlImageGridModel(QAbstractListModel):
                             mtime_ms=mtime_ms,
                             is_image=True,
                             key=key,
+                            thumb_url=_thumb_url(0, key),
                         )
                     )
                 except Exception:
@@ -178,6 +190,7 @@ class QmlImageGridModel(QAbstractListModel):
                 # row (DB preload or a newly generated thumb). This makes QML
                 # re-request the thumb via the provider.
                 e.thumb_gen += 1
+                e.thumb_url = _thumb_url(e.thumb_gen, e.key)
                 changed.add(idx)
 
         for idx in sorted(changed):
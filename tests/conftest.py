@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from helpers.qml_stubs import DummyQmlEngine
+
+# When run in parallel (`-n auto --dist=loadgroup`, see dev-docs/testing.md),
+# tests that touch a QApplication/display are pinned to one xdist worker;
+# everything else is spread across workers. Without xdist the marker is inert.
+_QT_GROUP = "qt"
+_QT_FIXTURES = frozenset({"qtbot", "qapp"})
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    for item in items:
+        if _QT_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.xdist_group(_QT_GROUP))
+
+
+@pytest.fixture(autouse=True)
+def _stub_qml_engine(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace QQmlApplicationEngine in image_viewer.main unless `requires_qml` is set.
+
+    Only applies when the test module already imported image_viewer.main, so
+    Qt-free tests never import PySide6 through this fixture.
+    """
+    if request.node.get_closest_marker("requires_qml") is not None:
+        return
+    main_mod = sys.modules.get("image_viewer.main")
+    if main_mod is not None:
+        monkeypatch.setattr(main_mod, "QQmlApplicationEngine", DummyQmlEngine)
@@ -0,0 +1,52 @@
+"""Lightweight stand-ins for QQmlApplicationEngine used by startup tests.
+
+They record what `image_viewer.main.run()` asks of the QML engine without
+parsing or instantiating any QML.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class DummyRoot:
+    def __init__(self) -> None:
+        self.properties: dict[str, Any] = {}
+
+    def setProperty(self, name: str, value: Any) -> bool:  # noqa: N802 - Qt API name
+        self.properties[name] = value
+        return True
+
+
+class _DummyContext:
+    def __init__(self) -> None:
+        self.properties: dict[str, Any] = {}
+
+    def setContextProperty(self, name: str, value: Any) -> None:  # noqa: N802 - Qt API name
+        self.properties[name] = value
+
+
+class DummyQmlEngine:
+    """Accepts the calls `run()` makes and reports one loaded root object."""
+
+    def __init__(self, *_args: Any, **_kwargs: Any) -> None:
+        self.root = DummyRoot()
+        self.context = _DummyContext()
+        self.image_providers: dict[str, Any] = {}
+        self.import_paths: list[str] = []
+        self.loaded: list[Any] = []
+
+    def addImageProvider(self, name: str, provider: Any) -> None:  # noqa: N802 - Qt API name
+        self.image_providers[name] = provider
+
+    def rootContext(self) -> _DummyContext:  # noqa: N802 - Qt API name
+        return self.context
+
+    def addImportPath(self, path: str) -> None:  # noqa: N802 - Qt API name
+        self.import_paths.append(path)
+
+    def load(self, url: Any) -> None:
+        self.loaded.append(url)
+
+    def rootObjects(self) -> list[DummyRoot]:  # noqa: N802 - Qt API name
+        return [self.root] if self.loaded else []
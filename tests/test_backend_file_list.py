@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from image_viewer.app.backend import BackendFacade
+from image_viewer.infra.path_utils import abs_path_str
+
+
+class _FakeExplorer:
+    def __init__(self) -> None:
+        self.image_files: list[str] = []
+
+    def _set_image_files(self, files: list[str]) -> None:
+        self.image_files = files
+
+    def _get_current_index(self) -> int:
+        return -1
+
+
+class _FakeBackend:
+    """Just the state `_on_engine_file_list_updated` touches."""
+
+    def __init__(self, pending: str | None, fail_on: int | None = None) -> None:
+        self._explorer = _FakeExplorer()
+        self._pending_select_path = pending
+        self._fail_on = fail_on
+        self.selected: list[int] = []
+
+    def _set_current_index(self, idx: int) -> None:
+        if idx == self._fail_on:
+            raise ValueError("boom")
+        self.selected.append(idx)
+
+
+def _files(tmp_path: Path) -> list[str]:
+    return [str(tmp_path / name) for name in ("a.jpg", "b.jpg", "c.jpg")]
+
+
+def test_pending_selection_picks_its_index(tmp_path: Path) -> None:
+    files = _files(tmp_path)
+    fake = _FakeBackend(pending=files[2])
+
+    BackendFacade._on_engine_file_list_updated(fake, files)
+
+    assert fake.selected == [2]
+    assert fake._explorer.image_files == [abs_path_str(f) for f in files]
+
+
+def test_missing_pending_selection_falls_back_to_first(tmp_path: Path) -> None:
+    fake = _FakeBackend(pending=str(tmp_path / "gone.jpg"))
+
+    BackendFacade._on_engine_file_list_updated(fake, _files(tmp_path))
+
+    assert fake.selected == [0]
+
+
+def test_errors_while_selecting_are_not_swallowed(tmp_path: Path) -> None:
+    files = _files(tmp_path)
+    fake = _FakeBackend(pending=files[1], fail_on=1)
+
+    # A ValueError from selecting the pending path must surface, not be
+    # mistaken for "path not in list" and fall back to index 0.
+    with pytest.raises(ValueError, match="boom"):
+        BackendFacade._on_engine_file_list_updated(fake, files)
+    assert fake.selected == []
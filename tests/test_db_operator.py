@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from image_viewer.image_engine.db import db_operator as db_operator_mod
+from image_viewer.image_engine.db.db_operator import DbOperator
+from image_viewer.image_engine.metrics import metrics
+
+
+def _create_db(db_path: Path) -> None:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_metrics_db_operator_basic(tmp_path: Path) -> None:
+    db_path = tmp_path / "op.db"
+    _create_db(db_path)
+    metrics.reset()
+    op = DbOperator(db_path)
+    try:
+        futs = [op.schedule_write(lambda conn, i=i: conn.execute("INSERT INTO t (v) VALUES (?)", (str(i),))) for i in range(3)]
+        for f in futs:
+            f.result(timeout=5)
+        count = op.schedule_read(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]).result(timeout=5)
+    finally:
+        op.shutdown(wait=True)
+
+    assert count == 3
+    snap = metrics.snapshot()
+    assert snap["counters"].get("db_operator.write_queued") == 3
+    assert snap["counters"].get("db_operator.read_queued") == 1
+
+
+def test_metrics_db_operator_retry_counts(tmp_path: Path) -> None:
+    db_path = tmp_path / "op.db"
+    _create_db(db_path)
+    metrics.reset()
+    calls = {"n": 0}
+
+    def _flaky(conn: sqlite3.Connection) -> str:
+        calls["n"] += 1
+        # Writes start inside an explicit BEGIN IMMEDIATE transaction.
+        assert conn.in_transaction
+        conn.execute("INSERT INTO t (v) VALUES ('x')")
+        if calls["n"] == 1:
+            raise sqlite3.OperationalError("database is locked")
+        return "ok"
+
+    op = DbOperator(db_path)
+    try:
+        assert op.schedule_write(_flaky, retries=3).result(timeout=5) == "ok"
+        count = op.schedule_read(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]).result(timeout=5)
+    finally:
+        op.shutdown(wait=True)
+
+    assert calls["n"] == 2
+    # The failed attempt's insert was rolled back before the retry.
+    assert count == 1
+    assert metrics.snapshot()["counters"].get("db_operator.write_retries", 0) >= 1
+
+
+def test_db_operator_reuses_one_connection(tmp_path: Path) -> None:
+    db_path = tmp_path / "op.db"
+    _create_db(db_path)
+    # Without reader threads every task shares the writer's connection.
+    op = DbOperator(db_path, reader_count=0)
+    try:
+        first = op.schedule_write(lambda conn: id(conn)).result(timeout=5)
+        second = op.schedule_read(lambda conn: id(conn)).result(timeout=5)
+        # A failing task must not poison the shared connection for later tasks.
+        failed = op.schedule_write(lambda conn: 1 / 0)
+        assert isinstance(failed.exception(timeout=5), ZeroDivisionError)
+        third = op.schedule_write(lambda conn: conn.execute("INSERT INTO t (v) VALUES ('y')") and id(conn)).result(
+            timeout=5
+        )
+    finally:
+        op.shutdown(wait=True)
+
+    assert first == second == third
+
+
+def test_idle_operator_closes_connections_and_wal_files(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(db_operator_mod, "_IDLE_CLOSE_S", 0.2)
+    db_path = tmp_path / "op.db"
+    _create_db(db_path)
+    side_files = [db_path.with_name(db_path.name + suffix) for suffix in ("-wal", "-shm")]
+    op = DbOperator(db_path, reader_count=2)
+    try:
+        op.schedule_write(lambda conn: conn.execute("INSERT INTO t (v) VALUES ('x')")).result(timeout=5)
+        assert op.schedule_read(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]).result(timeout=5)
+        assert any(p.exists() for p in side_files)
+
+        # Once every worker has been idle its connection is closed; the last
+        # close checkpoints the WAL and SQLite removes the side files.
+        deadline = time.monotonic() + 5
+        while any(p.exists() for p in side_files) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not any(p.exists() for p in side_files)
+
+        # The operator stays usable and reopens on demand.
+        assert op.is_alive()
+        assert op.schedule_read(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]).result(timeout=5)
+    finally:
+        op.shutdown(wait=True)
+
+
+def test_reads_run_alongside_an_open_write(tmp_path: Path) -> None:
+    db_path = tmp_path / "op.db"
+    _create_db(db_path)
+    op = DbOperator(db_path, reader_count=2)
+    in_write = threading.Event()
+    release = threading.Event()
+
+    def _slow_write(conn):
+        conn.execute("INSERT INTO t (v) VALUES ('pending')")
+        in_write.set()
+        assert release.wait(timeout=5)
+        return id(conn)
+
+    try:
+        write = op.schedule_write(_slow_write)
+        assert in_write.wait(timeout=5)
+        # The writer holds its transaction open; WAL readers still see the
+        # last committed snapshot on their own connections.
+        read_ids = {op.schedule_read(lambda conn: id(conn)).result(timeout=5) for _ in range(4)}
+        before = op.schedule_read(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]).result(timeout=5)
+        release.set()
+        write_id = write.result(timeout=5)
+        after = op.schedule_read(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]).result(timeout=5)
+    finally:
+        release.set()
+        op.shutdown(wait=True)
+
+    assert (before, after) == (0, 1)
+    assert write_id not in read_ids
+    assert not op.is_alive()
+
+
+def test_db_operator_connection_pragmas(tmp_path: Path) -> None:
+    db_path = tmp_path / "op.db"
+    _create_db(db_path)
+    op = DbOperator(db_path)
+    try:
+        journal, sync, cache_size = op.schedule_read(
+            lambda conn: (
+                conn.execute("PRAGMA journal_mode").fetchone()[0],
+                conn.execute("PRAGMA synchronous").fetchone()[0],
+                conn.execute("PRAGMA cache_size").fetchone()[0],
+            )
+        ).result(timeout=5)
+    finally:
+        op.shutdown(wait=True)
+
+    assert journal == "wal"
+    assert sync == 1  # NORMAL
+    assert cache_size < 0  # sized in KiB, not pages
+
+
+def test_failed_write_task_rolls_back_ddl(tmp_path: Path) -> None:
+    db_path = tmp_path / "op.db"
+    _create_db(db_path)
+
+    def _rebuild_then_fail(conn: sqlite3.Connection) -> None:
+        conn.execute("DROP TABLE t")
+        conn.execute("CREATE TABLE t2 (id INTEGER)")
+        raise RuntimeError("boom")
+
+    op = DbOperator(db_path)
+    try:
+        assert isinstance(op.schedule_write(_rebuild_then_fail).exception(timeout=5), RuntimeError)
+        tables = op.schedule_read(
+            lambda conn: sorted(r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'"))
+        ).result(timeout=5)
+    finally:
+        op.shutdown(wait=True)
+
+    # DROP + CREATE ran in the task's single transaction and were undone together.
+    assert tables == ["t"]
+
+
+def test_failed_commit_is_reported_and_not_left_open(tmp_path: Path) -> None:
+    db_path = tmp_path / "op.db"
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        conn.execute("CREATE TABLE child (pid INTEGER REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)")
+        conn.commit()
+    finally:
+        conn.close()
+
+    # Single connection: the PRAGMA below must apply to the writer's connection.
+    op = DbOperator(db_path, reader_count=0)
+    try:
+        # foreign_keys can only be toggled outside a transaction (reads don't open one).
+        op.schedule_read(lambda c: c.execute("PRAGMA foreign_keys=ON")).result(timeout=5)
+        # The deferred FK violation only surfaces at COMMIT.
+        bad = op.schedule_write(lambda c: c.execute("INSERT INTO child VALUES (42)"))
+        assert isinstance(bad.exception(timeout=5), sqlite3.IntegrityError)
+
+        op.schedule_write(lambda c: c.execute("INSERT INTO parent VALUES (1)")).result(timeout=5)
+        counts = op.schedule_read(
+            lambda c: (
+                c.execute("SELECT COUNT(*) FROM parent").fetchone()[0],
+                c.execute("SELECT COUNT(*) FROM child").fetchone()[0],
+            )
+        ).result(timeout=5)
+    finally:
+        op.shutdown(wait=True)
+
+    assert counts == (1, 0)
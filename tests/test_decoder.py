@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pyvips = pytest.importorskip("pyvips")
+
+from image_viewer.image_engine.decoder import encode_image_to_png  # noqa: E402
+
+pytestmark = pytest.mark.imaging
+
+
+def test_encode_image_to_png_thumbnail_round_trip(tmp_path: Path) -> None:
+    src = tmp_path / "photo.png"
+    pyvips.Image.black(400, 300, bands=3).write_to_file(str(src))
+
+    path, png, error = encode_image_to_png(str(src), 200, 150)
+
+    assert (path, error) == (str(src), None)
+    assert isinstance(png, bytes)
+    thumb = pyvips.Image.new_from_buffer(png, "")
+    assert (thumb.width, thumb.height, thumb.bands) == (200, 150, 3)
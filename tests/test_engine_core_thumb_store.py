@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from image_viewer.image_engine.db.db_operator import DbOperator
+from image_viewer.image_engine.db.thumbdb_bytes_adapter import ThumbDBBytesAdapter
+from image_viewer.image_engine.engine_core import _UPSERT_BATCH_MAX, EngineCore
+
+
+class _CountingAdapter(ThumbDBBytesAdapter):
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(db_path)
+        self.batches: list[int] = []
+
+    def upsert_meta_many(self, rows) -> None:
+        self.batches.append(len(rows))
+        super().upsert_meta_many(rows)
+
+
+def test_generated_thumbnails_are_stored_in_batches(qapp, tmp_path: Path) -> None:
+    paths = []
+    for i in range(_UPSERT_BATCH_MAX + 3):
+        p = tmp_path / f"img_{i:03d}.png"
+        p.write_bytes(b"x")
+        paths.append(str(p))
+
+    core = EngineCore()
+    core.initialize()
+    db = _CountingAdapter(tmp_path / "SwiftView_thumbs.db")
+    core._db = db
+    try:
+        for p in paths:
+            core._on_thumb_decoded(p, b"png-bytes", None)
+
+        # A full batch is written as soon as it fills; the tail waits for the timer.
+        assert db.batches == [_UPSERT_BATCH_MAX]
+        assert len(core._pending_upserts) == len(paths) - _UPSERT_BATCH_MAX
+
+        core.shutdown()
+
+        assert db.batches == [_UPSERT_BATCH_MAX, len(paths) - _UPSERT_BATCH_MAX]
+        reopened = ThumbDBBytesAdapter(db.db_path)
+        try:
+            assert len(reopened.get_rows_for_paths(paths)) == len(paths)
+        finally:
+            reopened.close()
+    finally:
+        db.close()
+        DbOperator.shutdown_all(wait=True)
+
+
+def test_empty_thumbnail_is_not_queued_for_storage(tmp_path: Path) -> None:
+    img = tmp_path / "broken.png"
+    img.write_bytes(b"x")
+    core = EngineCore()
+    errors: list[tuple[str, str]] = []
+    generated: list[dict] = []
+    core.error.connect(lambda where, msg: errors.append((where, msg)))
+    core.thumb_generated.connect(generated.append)
+
+    core._on_thumb_decoded(str(img), b"", None)
+
+    assert core._pending_upserts == []
+    assert generated == []
+    assert [where for where, _msg in errors] == ["thumb_encode"]
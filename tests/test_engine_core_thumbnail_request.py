@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+
+from image_viewer.image_engine.engine_core import EngineCore
+
+
+class FakeLoader:
+    def __init__(self) -> None:
+        # Bounded so stress variants reusing the fake cannot grow without limit.
+        self.requests: deque[tuple[str, int | None, int | None, str]] = deque(maxlen=10_000)
+
+    def request_load(self, path: str, target_width=None, target_height=None, size="both") -> None:
+        self.requests.append((path, target_width, target_height, size))
+
+
+def _core_with_fake_loader() -> tuple[EngineCore, FakeLoader]:
+    # EngineCore is used directly (no ImageEngine/threads/DB) since only the
+    # request gating is under test.
+    core = EngineCore()
+    fake = FakeLoader()
+    core._thumb_loader = fake  # type: ignore[assignment]
+    return core, fake
+
+
+def test_non_image_file_not_queued(tmp_path: Path) -> None:
+    txt = tmp_path / "notes.txt"
+    txt.write_text("hello")
+
+    core, fake = _core_with_fake_loader()
+    core.request_thumbnail(str(txt))
+
+    assert len(fake.requests) == 0
+
+
+def test_image_file_is_queued_once(tmp_path: Path) -> None:
+    img = tmp_path / "photo.JPG"
+    img.write_bytes(b"x")
+
+    core, fake = _core_with_fake_loader()
+    core.request_thumbnail(str(img))
+    core.request_thumbnail(str(img))
+
+    assert len(fake.requests) == 1
+    assert fake.requests[0][0] == str(img)
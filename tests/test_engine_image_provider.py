@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap
+
+from image_viewer.app.backend import EngineImageProvider
+
+
+class _FakeEngine:
+    def __init__(self, cache: dict[str, QPixmap]) -> None:
+        self._cache = cache
+        self.lookups: list[str] = []
+
+    def get_cached_pixmap(self, path: str) -> QPixmap | None:
+        self.lookups.append(path)
+        return self._cache.get(path)
+
+
+def test_engine_image_provider_strips_generation_and_decodes_percent(qapp) -> None:
+    engine = _FakeEngine({"C:/test with spaces.jpg": QPixmap(10, 10)})
+    provider = EngineImageProvider(engine)  # type: ignore[arg-type]
+
+    pix = provider.requestPixmap("1/C:/test%20with%20spaces.jpg", QSize(), QSize())
+
+    assert not pix.isNull()
+    assert engine.lookups == ["C:/test%20with%20spaces.jpg", "C:/test with spaces.jpg"]
+
+
+def test_engine_image_provider_miss_without_percent_skips_decode(qapp) -> None:
+    engine = _FakeEngine({})
+    provider = EngineImageProvider(engine)  # type: ignore[arg-type]
+
+    assert provider.requestPixmap("3/C:/missing.jpg", QSize(), QSize()).isNull()
+    assert engine.lookups == ["C:/missing.jpg"]
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from image_viewer.image_engine.db.db_operator import DbOperator
+from image_viewer.image_engine.db.thumbdb_bytes_adapter import (
+    _IN_LIST_MAX_PATHS,
+    _QUERY_PATHS_DDL,
+    ThumbDBBytesAdapter,
+    _rows_for_paths_sql,
+)
+from image_viewer.image_engine.fs_db_worker import FSDBLoadWorker
+from image_viewer.image_engine.meta_utils import to_mtime_ms_from_stat
+from image_viewer.infra.path_utils import db_key
+
+_FILE_COUNT = 1000
+
+
+def _make_paths(folder: Path, count: int) -> list[Path]:
+    paths: list[Path] = []
+    for i in range(count):
+        p = folder / f"img_{i:05d}.jpg"
+        p.write_bytes(b"x")
+        paths.append(p)
+    return paths
+
+
+_INSERT_COLS = "(path, mtime, size, width, height, thumb_width, thumb_height, thumbnail, created_at)"
+_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+# Stay under the conservative SQLITE_MAX_VARIABLE_NUMBER default (999): 9 params per row.
+_MAX_ROWS_PER_INSERT = 999 // 9
+
+
+def _create_db_for_many(db_path: Path, paths: list[Path]) -> None:
+    # Let the adapter create the schema so the test follows the production contract.
+    ThumbDBBytesAdapter(db_path).close()
+
+    created_at = time.time()
+    rows = []
+    for p in paths:
+        st = p.stat()
+        rows.append((db_key(p), to_mtime_ms_from_stat(st), int(st.st_size), 1, 1, 256, 195, b"thumb", created_at))
+
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        # Same connection setup as DbOperator, so the seed never runs in
+        # rollback-journal mode or fails fast on a busy DB.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("BEGIN")
+        if len(rows) < _MAX_ROWS_PER_INSERT:
+            conn.executemany(f"INSERT OR REPLACE INTO thumbnails {_INSERT_COLS} VALUES {_ROW_PLACEHOLDERS}", rows)
+        else:
+            for i in range(0, len(rows), _MAX_ROWS_PER_INSERT):
+                batch = rows[i : i + _MAX_ROWS_PER_INSERT]
+                values = ",".join([_ROW_PLACEHOLDERS] * len(batch))
+                params = [v for row in batch for v in row]
+                conn.execute(f"INSERT OR REPLACE INTO thumbnails {_INSERT_COLS} VALUES {values}", params)
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def _run_worker(worker: FSDBLoadWorker) -> tuple[int, int]:
+    loaded: list[dict] = []
+    missing: list[str] = []
+    worker.chunk_loaded.connect(loaded.extend)
+    worker.missing_paths.connect(missing.extend)
+    worker.run()
+    return len(loaded), len(missing)
+
+
+@pytest.fixture(scope="session")
+def big_db(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path, list[Path]]:
+    """Build the 1000-file folder + populated thumbnail DB once per session."""
+    folder = tmp_path_factory.mktemp("big_db") / "images"
+    folder.mkdir()
+    paths = _make_paths(folder, _FILE_COUNT)
+    db_path = folder / "SwiftView_thumbs.db"
+    _create_db_for_many(db_path, paths)
+    DbOperator.shutdown_all(wait=True)
+    return folder, db_path, paths
+
+
+def _drop_os_page_cache(path: Path) -> None:
+    """Best-effort eviction of `path` from the OS page cache (POSIX only)."""
+    fadvise = getattr(os, "posix_fadvise", None)
+    if fadvise is None:
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.parametrize("count", [200, 800], ids=["in_list", "temp_table"])
+def test_get_rows_for_paths_query_uses_path_index(big_db: tuple[Path, Path, list[Path]], count: int) -> None:
+    # The worker's chunked lookup must be served by the primary-key index on
+    # `path`; a covering (path, mtime, size) index cannot help because the
+    # thumbnail BLOB is always selected alongside the stats.
+    _folder, db_path, paths = big_db
+    keys = [db_key(p) for p in paths[:count]]
+    sql = _rows_for_paths_sql(len(keys))
+    conn = sqlite3.connect(str(db_path))
+    try:
+        if len(keys) > _IN_LIST_MAX_PATHS:
+            conn.execute(_QUERY_PATHS_DDL)
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        else:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", keys).fetchall()
+    finally:
+        conn.close()
+    details = " ".join(str(row[-1]) for row in plan)
+    assert "SEARCH thumbnails USING INDEX" in details or "SEARCH thumbnails USING PRIMARY KEY" in details, details
+    assert "SCAN thumbnails" not in details, details
+
+
+@pytest.mark.parametrize("adapter_mode", ["owned", "shared"])
+@pytest.mark.parametrize("chunk_size", [100, 200, 400, 800, 1600, 3200])
+def test_fs_db_worker_perf_owned_vs_shared_adapter(
+    tmp_path: Path, big_db: tuple[Path, Path, list[Path]], record_property, chunk_size: int, adapter_mode: str
+) -> None:
+    """Time worker construction + run() with the same boundaries for both modes.
+
+    The worker always reads through a DbOperator. In "owned" mode it opens its
+    own adapter (operator thread start + schema check) inside the timed run;
+    in "shared" mode it reuses an already-open adapter the way EngineCore does,
+    so the difference is the per-run open cost that sharing amortizes.
+    """
+    folder, src_db, _paths = big_db
+    # Work on a private copy so schema checks/writes never leak between parametrizations.
+    db_path = tmp_path / "SwiftView_thumbs.db"
+    shutil.copyfile(src_db, db_path)
+
+    # Each variant measures a cold read of its own DB copy.
+    _drop_os_page_cache(db_path)
+
+    shared = ThumbDBBytesAdapter(db_path) if adapter_mode == "shared" else None
+    try:
+        t0 = time.perf_counter_ns()
+        worker = FSDBLoadWorker(folder_path=str(folder), db_path=str(db_path), db_adapter=shared, chunk_size=chunk_size)
+        counts = _run_worker(worker)
+        elapsed_ns = time.perf_counter_ns() - t0
+    finally:
+        if shared is not None:
+            shared.close()
+
+    assert counts == (_FILE_COUNT, 0)
+
+    record_property("chunk_size", chunk_size)
+    record_property(f"{adapter_mode}_ms", round(elapsed_ns / 1e6, 3))
+
+    DbOperator.shutdown_all(wait=True)
+
+
+def test_fs_db_worker_rerun_reuses_adapter_and_releases_owned_operator(
+    tmp_path: Path, big_db: tuple[Path, Path, list[Path]]
+) -> None:
+    folder, src_db, _paths = big_db
+    db_path = tmp_path / "SwiftView_thumbs.db"
+    shutil.copyfile(src_db, db_path)
+    DbOperator.shutdown_all(wait=True)
+
+    worker = FSDBLoadWorker(folder_path=str(folder), db_path=str(db_path), chunk_size=400)
+
+    # Owned mode: the operator created for the run must not outlive it.
+    assert _run_worker(worker) == (_FILE_COUNT, 0)
+    assert not any(op.is_alive() for op in list(DbOperator._LIVE))
+
+    # Same instance, second run against a caller-owned adapter.
+    adapter = ThumbDBBytesAdapter(db_path)
+    try:
+        worker.configure(db_adapter=adapter)
+        assert _run_worker(worker) == (_FILE_COUNT, 0)
+        assert adapter.operator.is_alive()
+    finally:
+        adapter.close()
+
+    DbOperator.shutdown_all(wait=True)
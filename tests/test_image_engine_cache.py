@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from PySide6.QtGui import QImage
+
+from image_viewer.image_engine.engine import ImageEngine
+
+
+def _image(side: int) -> QImage:
+    img = QImage(side, side, QImage.Format.Format_ARGB32)
+    img.fill(0)
+    return img
+
+
+def test_pixmap_cache_is_bounded_by_bytes(qapp) -> None:
+    engine = ImageEngine()
+    try:
+        one = 64 * 64 * 4
+        engine.set_cache_size(20, max_bytes=2 * one)
+        for name in ("a", "b", "c"):
+            engine._on_image_converted(name, _image(64), None)
+
+        assert [engine.is_cached(p) for p in ("a", "b", "c")] == [False, True, True]
+        assert engine._cache_bytes == 2 * one
+
+        # An image larger than the whole budget still stays cached on its own.
+        engine._on_image_converted("big", _image(128), None)
+        assert list(engine._pixmap_cache) == ["big"]
+
+        assert engine.remove_from_cache("big")
+        assert engine._cache_bytes == 0
+    finally:
+        engine.shutdown()
+
+
+def test_prefetch_over_byte_budget_keeps_displayed_image(qapp, monkeypatch) -> None:
+    engine = ImageEngine()
+    try:
+        # Folder open: the view requests files[0] and prefetches files[:6]; keep
+        # the decodes out of the loader and deliver the results by hand.
+        monkeypatch.setattr(engine._loader, "request_load", lambda *_a, **_k: None)
+        files = [f"img{i}" for i in range(6)]
+        one = 64 * 64 * 4
+        engine.set_cache_size(20, max_bytes=2 * one)
+        engine.request_decode(files[0])
+        engine.prefetch(files)
+        for name in files:
+            engine._on_image_converted(name, _image(64), None)
+
+        assert engine.is_cached(files[0])
+        assert engine.get_cached_pixmap(files[0]) is not None
+        assert list(engine._pixmap_cache) == [files[0], files[5]]
+        assert engine._cache_bytes == 2 * one
+    finally:
+        engine.shutdown()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "image_viewer.image_engine.db.db_operator",
+        "image_viewer.image_engine.db.thumbdb_bytes_adapter",
+        "image_viewer.image_engine.meta_utils",
+    ],
+)
+def test_db_layer_imports_without_pyside6(module: str) -> None:
+    # Run in a fresh interpreter: this process has usually imported PySide6 already.
+    code = f"import sys, {module}; sys.exit(1 if 'PySide6' in sys.modules else 0)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=_REPO_ROOT, capture_output=True, text=True, check=False)
+    assert result.returncode == 0, f"{module} pulled in PySide6\n{result.stderr}"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from image_viewer.ui.qml_models import QmlImageGridModel
+
+
+def _entry(path: str, *, is_image: bool = True) -> dict:
+    return {"path": path, "is_image": is_image, "size": 1500, "mtime_ms": 1_700_000_000_000}
+
+
+def test_set_entries_accepts_generator_and_keeps_only_images(qapp) -> None:
+    model = QmlImageGridModel()
+    snapshot = [_entry("C:/pics/a.jpg"), _entry("C:/pics/notes.txt", is_image=False), _entry("C:/pics/b.png")]
+
+    model.set_entries(d for d in snapshot)
+
+    roles = QmlImageGridModel.Roles
+    names = [model.data(model.index(row, 0), int(roles.Name)) for row in range(model.rowCount())]
+    assert names == ["a.jpg", "b.png"]
+    assert model.data(model.index(1, 0), int(roles.SizeText)) == "1.5 KB"
+    assert model.data(model.index(1, 0), int(roles.ThumbUrl)).startswith("image://thumb/0/")
+
+
+def test_thumb_url_follows_thumb_gen(qapp) -> None:
+    model = QmlImageGridModel()
+    model.set_entries([_entry("C:/pics/a.jpg")])
+    roles = QmlImageGridModel.Roles
+    idx = model.index(0, 0)
+    key = model.data(idx, int(roles.Key))
+    assert model.data(idx, int(roles.ThumbUrl)) == f"image://thumb/0/{key}"
+
+    model.update_thumb_rows([{"path": "C:/pics/a.jpg", "width": 64, "height": 48}])
+
+    assert model.data(idx, int(roles.ThumbUrl)) == f"image://thumb/1/{key}"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import image_viewer.main as main_mod
+
+
+class _Signal:
+    def connect(self, _slot: Any) -> None:
+        pass
+
+
+class _FakeApp:
+    def __init__(self, _argv: list[str]) -> None:
+        self.aboutToQuit = _Signal()
+
+    def exec(self) -> int:
+        return 0
+
+
+class _FakeEngine:
+    def shutdown(self) -> None:
+        pass
+
+
+class _FakeBackend:
+    def __init__(self, *, engine: Any, settings: Any) -> None:
+        self.engine_image_provider = object()
+        self.thumb_provider = object()
+        self.dispatched: list[tuple[str, dict]] = []
+        _FakeBackend.last = self
+
+    def dispatch(self, cmd: str, payload: dict) -> None:
+        self.dispatched.append((cmd, payload))
+
+
+class _FakeSettings:
+    def __init__(self, last_dir: str) -> None:
+        self.last_open_dir = last_dir
+        self.last_parent_dir = None
+
+    def get(self, _key: str, default: Any = None) -> Any:
+        return default
+
+
+def test_run_restores_last_folder(tmp_path: Path, monkeypatch) -> None:
+    folder = tmp_path / "photos"
+    folder.mkdir()
+
+    monkeypatch.setattr(main_mod, "QApplication", _FakeApp)
+    monkeypatch.setattr(main_mod.QQuickStyle, "setStyle", staticmethod(lambda _name: None))
+    monkeypatch.setattr(main_mod, "SettingsManager", lambda _path: _FakeSettings(str(folder)))
+    monkeypatch.setattr(main_mod, "apply_theme", lambda *_a, **_k: None)
+    monkeypatch.setattr(main_mod, "ImageEngine", _FakeEngine)
+    monkeypatch.setattr(main_mod, "BackendFacade", _FakeBackend)
+    # QQmlApplicationEngine is replaced by the autouse DummyQmlEngine fixture (tests/conftest.py).
+
+    assert main_mod.run(["image_viewer"]) == 0
+    assert _FakeBackend.last.dispatched == [("openFolder", {"path": str(folder)})]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import functools
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PySide6.QtGui import QPixmap
+
+from image_viewer.app.backend import ThumbImageProvider
+
+
+@functools.lru_cache(maxsize=None)
+def _solid_png(w: int, h: int, color: Qt.GlobalColor = Qt.GlobalColor.red) -> bytes:
+    # Fill a QPixmap directly (no QImage round trip) and cache the encoded bytes
+    # so repeated fixtures don't re-render/re-encode.
+    pix = QPixmap(w, h)
+    pix.fill(color)
+    ba = QByteArray()
+    buf = QBuffer(ba)
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    pix.save(buf, "PNG")
+    return bytes(ba.data())
+
+
+def test_thumb_provider_decodes_and_caches(qapp) -> None:
+    provider = ThumbImageProvider({"C:/a.jpg": _solid_png(8, 6)})
+
+    pix = provider.requestPixmap("3/C:/a.jpg", None, None)
+    assert (pix.width(), pix.height()) == (8, 6)
+    # Second request is served from the LRU without decoding again.
+    assert provider.requestPixmap("3/C:/a.jpg", None, None).cacheKey() == pix.cacheKey()
+
+
+def test_thumb_provider_reuses_placeholder_for_misses(qapp) -> None:
+    provider = ThumbImageProvider({"C:/broken.jpg": b"not a png"})
+
+    missing = provider.requestPixmap("1/C:/missing.jpg", None, None)
+    broken = provider.requestPixmap("1/C:/broken.jpg", None, None)
+
+    assert (missing.width(), missing.height()) == (1, 1)
+    assert missing.cacheKey() == broken.cacheKey()
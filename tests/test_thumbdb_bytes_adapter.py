@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from image_viewer.image_engine.db.db_operator import DbOperator
+from image_viewer.image_engine.db.thumbdb_bytes_adapter import THUMB_DB_SCHEMA_VERSION, ThumbDBBytesAdapter
+from image_viewer.infra.path_utils import db_key
+
+
+def _meta(created_at: float) -> dict:
+    return {
+        "thumbnail": b"png-bytes",
+        "width": 640,
+        "height": 480,
+        "thumb_width": 256,
+        "thumb_height": 195,
+        "created_at": created_at,
+    }
+
+
+def test_upsert_meta_many_round_trip(tmp_path: Path) -> None:
+    db = ThumbDBBytesAdapter(tmp_path / "thumbs.db")
+    try:
+        base = tmp_path.as_posix()
+        rows = [(f"{base}/img-{i}.jpg", 1000 + i, 10 + i, _meta(time.time())) for i in range(20)]
+        db.upsert_meta_many(rows)
+        # Second batch updates existing rows instead of failing on the PK.
+        db.upsert_meta_many([(f"{base}/img-0.jpg", 5, 6, None)])
+
+        got = {r[0]: r for r in db.get_rows_for_paths([p for p, _m, _s, _meta in rows])}
+        assert len(got) == len(rows)
+        assert got[f"{base}/img-0.jpg"][4:6] == (5, 6)
+        assert got[f"{base}/img-0.jpg"][1] is None
+        assert got[f"{base}/img-1.jpg"][1] == b"png-bytes"
+    finally:
+        db.close()
+        DbOperator.shutdown_all(wait=True)
+
+
+def test_batched_and_existence_probes_match_probe(tmp_path: Path) -> None:
+    db = ThumbDBBytesAdapter(tmp_path / "thumbs.db")
+    try:
+        base = tmp_path.as_posix()
+        stored = [f"{base}/img-{i}.jpg" for i in range(3)]
+        db.upsert_meta_many([(p, 1000, 10, _meta(time.time())) for p in stored])
+
+        found = db.probe_many([*stored, f"{base}/missing.jpg"])
+
+        assert found == {db_key(p): db.probe(p) for p in stored}
+        assert db.probe_exists(stored[0])
+        assert not db.probe_exists(f"{base}/missing.jpg")
+    finally:
+        db.close()
+        DbOperator.shutdown_all(wait=True)
+
+
+def test_thumb_db_concurrent_upsert_and_read(tmp_path: Path) -> None:
+    writer_count = 4
+    reader_count = 3
+    writer_loop = 50
+    # Readers only sample: enough overlap to catch torn batches without
+    # turning the test into a lock-contention benchmark.
+    reader_samples = 5
+    seed_count = 200
+    base = tmp_path.as_posix()
+    seed_paths = [f"{base}/seed-{i}.jpg" for i in range(seed_count)]
+    # Build every path once; writers, readers and the final check share these lists.
+    writer_paths = [[f"{base}/w{i}-{j}.jpg" for j in range(writer_loop)] for i in range(writer_count)]
+    writer_path_sets = [frozenset(paths) for paths in writer_paths]
+    all_paths = [p for paths in writer_paths for p in paths]
+
+    db = ThumbDBBytesAdapter(tmp_path / "thumbs.db")
+    # Seed a baseline in one transaction so readers hit real rows while the
+    # writers race, instead of probing an empty table.
+    seed_created_at = time.time()
+    db.upsert_meta_many([(p, 1, 1, _meta(seed_created_at)) for p in seed_paths])
+    # Timeout so a thread failing before the barrier breaks it instead of hanging the rest.
+    barrier = threading.Barrier(writer_count + reader_count, timeout=30)
+
+    def _writer(idx: int) -> None:
+        barrier.wait()
+        created_at = time.time()
+        rows = [(p, 1000 + j, 10 + j, _meta(created_at)) for j, p in enumerate(writer_paths[idx])]
+        # One transaction per writer instead of one per row.
+        db.upsert_meta_many(rows)
+
+    def _reader(idx: int) -> list[int]:
+        paths = seed_paths + writer_paths[idx % writer_count]
+        wanted = writer_path_sets[idx % writer_count].union(seed_paths)
+        barrier.wait()
+        seen: list[int] = []
+        for _ in range(reader_samples):
+            rows = db.get_rows_for_paths(paths)
+            # Every returned row must be one we asked for and fully written.
+            assert all(r[0] in wanted and r[1] == b"png-bytes" for r in rows)
+            seen.append(len(rows))
+        return seen
+
+    try:
+        with ThreadPoolExecutor(max_workers=writer_count + reader_count) as pool:
+            writers = [pool.submit(_writer, i) for i in range(writer_count)]
+            readers = [pool.submit(_reader, i) for i in range(reader_count)]
+            # result() re-raises any assertion or DB error from the worker.
+            for fut in writers:
+                fut.result(timeout=30)
+            readers_results = [fut.result(timeout=30) for fut in readers]
+
+        # Seed rows are always visible, and each writer's batch commits
+        # atomically: readers see none or all of it on top of the seed.
+        for seen in readers_results:
+            assert set(seen) <= {seed_count, seed_count + writer_loop}, seen
+
+        assert len(db.get_rows_for_paths(all_paths)) == writer_count * writer_loop
+    finally:
+        db.close()
+        DbOperator.shutdown_all(wait=True)
+
+
+def test_mismatched_schema_is_recreated(tmp_path: Path) -> None:
+    db_path = tmp_path / "thumbs.db"
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("CREATE TABLE thumbnails (path TEXT PRIMARY KEY, thumbnail BLOB)")
+        conn.execute("INSERT INTO thumbnails VALUES ('a', x'00')")
+        conn.commit()
+    finally:
+        conn.close()
+
+    db = ThumbDBBytesAdapter(db_path)
+    try:
+        cols = db.operator.schedule_read(
+            lambda c: [r[1] for r in c.execute("PRAGMA table_info(thumbnails)")]
+        ).result(timeout=5)
+        version = db.operator.schedule_read(lambda c: c.execute("PRAGMA user_version").fetchone()[0]).result(timeout=5)
+        assert "created_at" in cols
+        assert version == THUMB_DB_SCHEMA_VERSION
+        assert db.probe("a") is None
+    finally:
+        db.close()
+        DbOperator.shutdown_all(wait=True)
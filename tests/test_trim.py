@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+pyvips = pytest.importorskip("pyvips")
+
+from image_viewer.trim.trim import detect_trim_box_stats  # noqa: E402
+from image_viewer.trim.trim_operations import TrimPreloader  # noqa: E402
+from image_viewer.trim.ui_trim import TrimBatchWorker  # noqa: E402
+
+pytestmark = pytest.mark.imaging
+
+
+_Box = tuple[int, int, int, int]
+
+
+@pytest.fixture(scope="session")
+def white_with_block(tmp_path_factory: pytest.TempPathFactory) -> Callable[[int, int, _Box | None], str]:
+    """Return a factory for white RGB PNGs with a black rectangle at `box` = (left, top, w, h).
+
+    Each distinct (width, height, box) is encoded once per session and shared
+    by every test that asks for it; the tests only ever read these files.
+    """
+    folder = tmp_path_factory.mktemp("trim_images")
+    cache: dict[tuple[int, int, _Box | None], str] = {}
+
+    def _make(width: int, height: int, box: _Box | None) -> str:
+        key = (width, height, box)
+        if key not in cache:
+            img = pyvips.Image.black(width, height, bands=3) + 255
+            if box is not None:
+                left, top, w, h = box
+                img = img.draw_rect([0, 0, 0], left, top, w, h, fill=True)
+            path = folder / f"img_{len(cache)}.png"
+            img.cast("uchar").write_to_file(str(path))
+            cache[key] = str(path)
+        return cache[key]
+
+    return _make
+
+
+@pytest.mark.parametrize(
+    "box",
+    [(10, 5, 30, 20), (0, 0, 80, 60), (79, 59, 1, 1), (0, 30, 80, 1)],
+    ids=["inner", "full", "last_pixel", "single_row"],
+)
+def test_detect_trim_box_stats_finds_content_bounds(white_with_block, box: _Box) -> None:
+    path = white_with_block(80, 60, box)
+
+    assert detect_trim_box_stats(path) == box
+
+
+def test_detect_trim_box_stats_blank_image_has_no_box(white_with_block) -> None:
+    path = white_with_block(40, 30, None)
+
+    assert detect_trim_box_stats(path) is None
+
+
+def test_detect_trim_box_stats_unreadable_file_has_no_box(tmp_path: Path) -> None:
+    path = tmp_path / "broken.png"
+    path.write_bytes(b"not an image")
+
+    assert detect_trim_box_stats(str(path)) is None
+
+
+@pytest.mark.parametrize(("profile", "expected"), [(None, None), ("aggressive", (0, 0, 4, 4))])
+def test_detect_trim_box_stats_threshold_follows_profile(
+    tmp_path: Path, profile: str | None, expected: _Box | None
+) -> None:
+    # Channel mean 247: background for the normal profile (>= 245), content for aggressive (< 250).
+    path = tmp_path / "grey.png"
+    pyvips.Image.black(4, 4, bands=3).linear([1, 1, 1], [246, 247, 248]).cast("uchar").write_to_file(str(path))
+
+    assert detect_trim_box_stats(str(path), profile=profile) == expected
+
+
+def test_preloader_candidate_crops_preview_from_decoded_pixels(qapp, white_with_block) -> None:
+    path = white_with_block(80, 60, (10, 5, 30, 20))
+
+    candidate = TrimPreloader([path], profile="normal")._load_candidate(path)
+
+    assert candidate is not None
+    assert candidate.crop == (10, 5, 30, 20)
+    assert candidate.original_array.shape[:2] == (60, 80)
+    assert (candidate.trimmed_pixmap.width(), candidate.trimmed_pixmap.height()) == (30, 20)
+
+
+def test_preloader_skips_image_without_margins(qapp, white_with_block) -> None:
+    path = white_with_block(80, 60, (0, 0, 80, 60))
+
+    assert TrimPreloader([path], profile="normal")._load_candidate(path) is None
+
+
+def test_batch_worker_reports_in_input_order(qapp, tmp_path: Path, white_with_block) -> None:
+    boxes = [(10, 5, 30, 20), None, (0, 0, 80, 60), (1, 2, 3, 4)]
+    paths = []
+    for i, box in enumerate(boxes):
+        # Private copies: the worker writes `.trim` siblings next to its inputs.
+        paths.append(str(shutil.copy(white_with_block(80, 60, box), tmp_path / f"in_{i}.png")))
+    progress: list[tuple[str, int]] = []
+    worker = TrimBatchWorker(paths, "normal")
+    worker.progress.connect(lambda p, idx, _total, _err: progress.append((p, idx)))
+
+    worker.run()
+
+    assert progress == [(p, i) for i, p in enumerate(paths, start=1)]
+    assert worker.report_rows == [
+        (paths[0], 80, 60, 30, 20),
+        (paths[1], 80, 60, 0, 0),
+        (paths[2], 80, 60, 80, 60),
+        (paths[3], 80, 60, 3, 4),
+    ]
+    written = sorted(p.name for p in tmp_path.glob("*.trim.png"))
+    assert written == ["in_0.trim.png", "in_3.trim.png"]